@@ -238,49 +238,43 @@ def get_boolean_setting(env_var=None, config_key=None, default_value=False):
     return is_true(get_setting(env_var, config_key, default_value))
 
 
-def get_media_dir(create=True):
-    """Return the absolute path for the 'media' directory (where uploaded files are stored)."""
-    md = get_setting('INVENTREE_MEDIA_ROOT', 'media_root')
+def get_settings_dir(env_var, config_key, create=True) -> Path:
+    """Return the absolute path for a directory specified in the settings.
 
-    if not md:
-        raise FileNotFoundError('INVENTREE_MEDIA_ROOT not specified')
+    Arguments:
+        env_var: Name of the environment variable to check
+        config_key: Key to lookup in the configuration file
+        create: If True, create the directory if it does not already exist
 
-    md = Path(md).resolve()
+    Raises:
+        FileNotFoundError: If the directory is not specified
+    """
+    directory = get_setting(env_var, config_key)
 
-    if create:
-        md.mkdir(parents=True, exist_ok=True)
+    if not directory:
+        raise FileNotFoundError(f'{env_var} not specified')
 
-    return md
+    directory = Path(directory).resolve()
 
+    if create:
+        directory.mkdir(parents=True, exist_ok=True)
 
-def get_static_dir(create=True):
-    """Return the absolute path for the 'static' directory (where static files are stored)."""
-    sd = get_setting('INVENTREE_STATIC_ROOT', 'static_root')
+    return directory
 
-    if not sd:
-        raise FileNotFoundError('INVENTREE_STATIC_ROOT not specified')
 
-    sd = Path(sd).resolve()
+def get_media_dir(create=True):
+    """Return the absolute path for the 'media' directory (where uploaded files are stored)."""
+    return get_settings_dir('INVENTREE_MEDIA_ROOT', 'media_root', create=create)
 
-    if create:
-        sd.mkdir(parents=True, exist_ok=True)
 
-    return sd
+def get_static_dir(create=True):
+    """Return the absolute path for the 'static' directory (where static files are stored)."""
+    return get_settings_dir('INVENTREE_STATIC_ROOT', 'static_root', create=create)
 
 
 def get_backup_dir(create=True):
     """Return the absolute path for the backup directory."""
-    bd = get_setting('INVENTREE_BACKUP_DIR', 'backup_dir')
-
-    if not bd:
-        raise FileNotFoundError('INVENTREE_BACKUP_DIR not specified')
-
-    bd = Path(bd).resolve()
-
-    if create:
-        bd.mkdir(parents=True, exist_ok=True)
-
-    return bd
+    return get_settings_dir('INVENTREE_BACKUP_DIR', 'backup_dir', create=create)
 
 
 def get_plugin_file():
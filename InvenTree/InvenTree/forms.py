@@ -1,7 +1,8 @@
 """Helper forms which subclass Django forms to provide additional functionality."""
 
 import logging
-from urllib.parse import urlencode
+import re
+from functools import lru_cache
 
 from django import forms
 from django.conf import settings
@@ -172,12 +173,19 @@ class CustomSignupForm(SignupForm):
 
     def __init__(self, *args, **kwargs):
         """Check settings to influence which fields are needed."""
-        kwargs['email_required'] = InvenTreeSetting.get_setting('LOGIN_MAIL_REQUIRED')
+        # Fetch all required settings at once, and reuse them for the lifetime of the form
+        self._settings = InvenTreeSetting.get_settings_bulk([
+            'LOGIN_MAIL_REQUIRED',
+            'LOGIN_SIGNUP_MAIL_TWICE',
+            'LOGIN_SIGNUP_PWD_TWICE',
+        ])
+
+        kwargs['email_required'] = self._settings['LOGIN_MAIL_REQUIRED']
 
         super().__init__(*args, **kwargs)
 
         # check for two mail fields
-        if InvenTreeSetting.get_setting('LOGIN_SIGNUP_MAIL_TWICE'):
+        if self._settings['LOGIN_SIGNUP_MAIL_TWICE']:
             self.fields['email2'] = forms.EmailField(
                 label=_('Email (again)'),
                 widget=forms.TextInput(
@@ -189,7 +197,7 @@ class CustomSignupForm(SignupForm):
             )
 
         # check for two password fields
-        if not InvenTreeSetting.get_setting('LOGIN_SIGNUP_PWD_TWICE'):
+        if not self._settings['LOGIN_SIGNUP_PWD_TWICE']:
             self.fields.pop('password2')
 
         # reorder fields
@@ -202,7 +210,7 @@ class CustomSignupForm(SignupForm):
         cleaned_data = super().clean()
 
         # check for two mail fields
-        if InvenTreeSetting.get_setting('LOGIN_SIGNUP_MAIL_TWICE'):
+        if self._settings['LOGIN_SIGNUP_MAIL_TWICE']:
             email = cleaned_data.get('email')
             email2 = cleaned_data.get('email2')
             if (email and email2) and email != email2:
@@ -211,19 +219,71 @@ class CustomSignupForm(SignupForm):
         return cleaned_data
 
 
-def registration_enabled():
-    """Determine whether user registration is enabled."""
+def get_signup_settings(request=None):
+    """Return the settings which are required during user signup.
+
+    The settings are fetched with a single lookup,
+    and stored against the request object so that they are only retrieved once per request.
+    """
+    signup_settings = getattr(request, '_inventree_settings', None)
+
+    if signup_settings is None:
+        signup_settings = InvenTreeSetting.get_settings_bulk([
+            'LOGIN_SIGNUP_MAIL_RESTRICTION',
+            'SIGNUP_GROUP',
+        ])
+
+        if request is not None:
+            request._inventree_settings = signup_settings
+
+    return signup_settings
+
+
+@lru_cache(maxsize=8)
+def email_restriction_regex(mail_restriction):
+    """Compile the LOGIN_SIGNUP_MAIL_RESTRICTION setting into a single regular expression.
+
+    The returned pattern only matches email addresses which belong to one of the allowed domains.
+    Returns None if the setting is not configured correctly (each option must start with '@').
+    """
+    options = mail_restriction.split(',')
+
+    if not all(option.startswith('@') for option in options):
+        return None
+
+    domains = '|'.join(re.escape(option[1:]) for option in options)
+
+    return re.compile(rf'^[^@]+@({domains})$')
+
+
+def registration_enabled(request=None):
+    """Determine whether user registration is enabled.
+
+    If a request object is provided, the result is stored against the request,
+    so that repeated calls within the same request do not hit the database again.
+    """
+    enabled = getattr(request, '_registration_enabled', None)
+
+    if enabled is not None:
+        return enabled
+
+    enabled = False
+
     if (
         InvenTreeSetting.get_setting('LOGIN_ENABLE_REG')
         or InvenTree.sso.registration_enabled()
     ):
         if settings.EMAIL_HOST:
-            return True
+            enabled = True
         else:
             logger.error(
                 'Registration cannot be enabled, because EMAIL_HOST is not configured.'
             )
-    return False
+
+    if request is not None:
+        request._registration_enabled = enabled
+
+    return enabled
 
 
 class RegistratonMixin:
@@ -234,35 +294,34 @@ class RegistratonMixin:
 
         Configure the class variable `REGISTRATION_SETTING` to set which setting should be used, default: `LOGIN_ENABLE_REG`.
         """
-        if registration_enabled():
+        if registration_enabled(request):
             return super().is_open_for_signup(request, *args, **kwargs)
         return False
 
     def clean_email(self, email):
         """Check if the mail is valid to the pattern in LOGIN_SIGNUP_MAIL_RESTRICTION (if enabled in settings)."""
-        mail_restriction = InvenTreeSetting.get_setting(
-            'LOGIN_SIGNUP_MAIL_RESTRICTION', None
-        )
+        mail_restriction = get_signup_settings(getattr(self, 'request', None))[
+            'LOGIN_SIGNUP_MAIL_RESTRICTION'
+        ]
         if not mail_restriction:
             return super().clean_email(email)
 
-        split_email = email.split('@')
-        if len(split_email) != 2:
+        if email.count('@') != 1:
             logger.error('The user %s has an invalid email address', email)
             raise forms.ValidationError(
                 _('The provided primary email address is not valid.')
             )
 
-        mailoptions = mail_restriction.split(',')
-        for option in mailoptions:
-            if not option.startswith('@'):
-                log_error('LOGIN_SIGNUP_MAIL_RESTRICTION is not configured correctly')
-                raise forms.ValidationError(
-                    _('The provided primary email address is not valid.')
-                )
-            else:
-                if split_email[1] == option[1:]:
-                    return super().clean_email(email)
+        restriction_regex = email_restriction_regex(mail_restriction)
+
+        if restriction_regex is None:
+            log_error('LOGIN_SIGNUP_MAIL_RESTRICTION is not configured correctly')
+            raise forms.ValidationError(
+                _('The provided primary email address is not valid.')
+            )
+
+        if restriction_regex.fullmatch(email):
+            return super().clean_email(email)
 
         logger.info('The provided email domain for %s is not approved', email)
         raise forms.ValidationError(_('The provided email domain is not approved.'))
@@ -273,7 +332,7 @@ class RegistratonMixin:
         user = super().save_user(request, user, form)
 
         # Check if a default group is set in settings
-        start_group = InvenTreeSetting.get_setting('SIGNUP_GROUP')
+        start_group = get_signup_settings(request)['SIGNUP_GROUP']
         if start_group:
             try:
                 group = Group.objects.get(id=start_group)
@@ -353,7 +412,7 @@ class CustomSocialAccountAdapter(
             redirect_url = reverse('two-factor-authenticate')
             # Add GET parameters to the URL if they exist.
             if request.GET:
-                redirect_url += '?' + urlencode(request.GET)
+                redirect_url += '?' + request.GET.urlencode()
 
             raise ImmediateHttpResponse(response=HttpResponseRedirect(redirect_url))
 
@@ -390,6 +449,6 @@ class CustomRegisterSerializer(RegisterSerializer):
 
     def save(self, request):
         """Override to check if registration is open."""
-        if registration_enabled():
+        if registration_enabled(request):
             return super().save(request)
         raise forms.ValidationError(_('Registration is disabled.'))
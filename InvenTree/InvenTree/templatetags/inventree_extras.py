@@ -2,7 +2,9 @@
 
 import logging
 import os
+import re
 from datetime import date, datetime
+from functools import lru_cache
 
 from django import template
 from django.conf import settings as djangosettings
@@ -26,9 +28,61 @@ register = template.Library()
 
 logger = logging.getLogger('inventree')
 
+# Mapping of moment.js date format tokens to their python equivalents
+DATE_FORMAT_TOKENS = {'YYYY': '%Y', 'MMM': '%b', 'MM': '%m', 'DD': '%d'}
+DATE_FORMAT_REGEX = re.compile('|'.join(DATE_FORMAT_TOKENS.keys()))
+
+
+@lru_cache(maxsize=256)
+def convert_date_format(date_format: str) -> str:
+    """Convert a moment.js date format string (e.g. 'YYYY-MM-DD') to the python equivalent."""
+    return DATE_FORMAT_REGEX.sub(
+        lambda match: DATE_FORMAT_TOKENS[match.group()], date_format
+    )
+
+
+def get_cached_setting(context, key, user=None, user_setting=False):
+    """Return the value of a setting, cached against the current request.
+
+    A single page may request the same setting many times,
+    so the value is stored against the request object to prevent repeated lookups.
+
+    Arguments:
+        context: The template context
+        key: The setting key
+        user: The user to lookup a user setting for (optional)
+        user_setting: If True, lookup a user setting (even if no user is provided)
+    """
+    request = context.get('request', None)
+
+    settings_cache = getattr(request, '_settings_cache', None)
+
+    if settings_cache is None:
+        settings_cache = {}
+
+        if request is not None:
+            request._settings_cache = settings_cache
+
+    if user is not None or user_setting:
+        cache_key = (key, getattr(user, 'pk', None))
+    else:
+        cache_key = key
+
+    if cache_key not in settings_cache:
+        if user is not None:
+            value = common.models.InvenTreeUserSetting.get_setting(key, user=user)
+        elif user_setting:
+            value = common.models.InvenTreeUserSetting.get_setting(key)
+        else:
+            value = common.models.InvenTreeSetting.get_setting(key)
+
+        settings_cache[cache_key] = value
+
+    return settings_cache[cache_key]
+
 
 @register.simple_tag()
-def define(value, *args, **kwargs):
+def define(value, *args):
     """Shortcut function to overcome the shortcomings of the django templating language.
 
     Use as follows: {% define "hello_world" as hello %}
@@ -39,11 +93,39 @@ def define(value, *args, **kwargs):
 
 
 @register.simple_tag()
-def decimal(x, *args, **kwargs):
+def decimal(x):
     """Simplified rendering of a decimal number."""
     return InvenTree.helpers.decimal2string(x)
 
 
+def get_user_date_format(context):
+    """Return the (python) date format preferred by the user in the provided context.
+
+    The result is stored in the context, so that subsequent calls do not need to look it up again.
+    """
+    # We may have already pre-cached the date format by calling this already!
+    user_date_format = context.get('user_date_format', None)
+
+    if user_date_format is None:
+        user = context.get('user', None)
+
+        if user and user.is_authenticated:
+            # User is specified - look for their date display preference
+            user_date_format = get_cached_setting(
+                context, 'DATE_DISPLAY_FORMAT', user=user
+            )
+        else:
+            user_date_format = 'YYYY-MM-DD'
+
+        # Convert the format string to Pythonic equivalent
+        user_date_format = convert_date_format(user_date_format)
+
+        # Update the context cache
+        context['user_date_format'] = user_date_format
+
+    return user_date_format
+
+
 @register.simple_tag(takes_context=True)
 def render_date(context, date_object):
     """Renders a date according to the preference of the provided user.
@@ -54,6 +136,10 @@ def render_date(context, date_object):
     if date_object is None:
         return None
 
+    # Most commonly, a date (or datetime) object is provided
+    if isinstance(date_object, (datetime, date)):
+        return date_object.strftime(get_user_date_format(context))
+
     if isinstance(date_object, str):
         date_object = date_object.strip()
 
@@ -68,31 +154,8 @@ def render_date(context, date_object):
             logger.warning('Tried to convert invalid date string: %s', date_object)
             return None
 
-    # We may have already pre-cached the date format by calling this already!
-    user_date_format = context.get('user_date_format', None)
-
-    if user_date_format is None:
-        user = context.get('user', None)
-
-        if user and user.is_authenticated:
-            # User is specified - look for their date display preference
-            user_date_format = common.models.InvenTreeUserSetting.get_setting(
-                'DATE_DISPLAY_FORMAT', user=user
-            )
-        else:
-            user_date_format = 'YYYY-MM-DD'
-
-        # Convert the format string to Pythonic equivalent
-        replacements = [('YYYY', '%Y'), ('MMM', '%b'), ('MM', '%m'), ('DD', '%d')]
-
-        for o, n in replacements:
-            user_date_format = user_date_format.replace(o, n)
-
-        # Update the context cache
-        context['user_date_format'] = user_date_format
+        return date_object.strftime(get_user_date_format(context))
 
-    if isinstance(date_object, (datetime, date)):
-        return date_object.strftime(user_date_format)
     return date_object
 
 
@@ -103,13 +166,13 @@ def render_currency(money, **kwargs):
 
 
 @register.simple_tag()
-def str2bool(x, *args, **kwargs):
+def str2bool(x):
     """Convert a string to a boolean value."""
     return InvenTree.helpers.str2bool(x)
 
 
 @register.simple_tag()
-def add(x, y, *args, **kwargs):
+def add(x, y):
     """Add two numbers together."""
     return x + y
 
@@ -132,15 +195,15 @@ def inventree_in_debug_mode(*args, **kwargs):
     return djangosettings.DEBUG
 
 
-@register.simple_tag()
-def inventree_show_about(user, *args, **kwargs):
+@register.simple_tag(takes_context=True)
+def inventree_show_about(context, user, *args, **kwargs):
     """Return True if the about modal should be shown."""
-    if common.models.InvenTreeSetting.get_setting('INVENTREE_RESTRICT_ABOUT'):
-        # Return False if the user is not a superuser, or no user information is provided
-        if not user or not user.is_superuser:
-            return False
+    # Superusers can always see the about modal, no need to check the setting
+    if user and user.is_superuser:
+        return True
 
-    return True
+    # Return False if the about modal is restricted (to superusers only)
+    return not get_cached_setting(context, 'INVENTREE_RESTRICT_ABOUT')
 
 
 @register.simple_tag()
@@ -168,12 +231,18 @@ def plugins_info(*args, **kwargs):
     if not djangosettings.PLUGINS_ENABLED:
         return False
 
-    # Fetch plugins
-    plug_list = [plg for plg in registry.plugins.values() if plg.plugin_config().active]
-    # Format list
+    plug_list = list(registry.plugins.values())
+
+    # Fetch the configuration for all plugins in a single query
+    configs = plugin.models.PluginConfig.objects.in_bulk(
+        [plg.slug for plg in plug_list], field_name='key'
+    )
+
+    # Format list of active plugins
     return [
         {'name': plg.name, 'slug': plg.slug, 'version': plg.version}
         for plg in plug_list
+        if (cfg := configs.get(plg.slug)) and cfg.active
     ]
 
 
@@ -363,17 +432,17 @@ def setting_object(key, *args, **kwargs):
         return common.models.InvenTreeSetting.get_setting_object(key, cache=cache)
 
 
-@register.simple_tag()
-def settings_value(key, *args, **kwargs):
+@register.simple_tag(takes_context=True)
+def settings_value(context, key, *args, **kwargs):
     """Return a settings value specified by the given key."""
     if 'user' in kwargs:
         if not kwargs['user'] or (
             kwargs['user'] and kwargs['user'].is_authenticated is False
         ):
-            return common.models.InvenTreeUserSetting.get_setting(key)
-        return common.models.InvenTreeUserSetting.get_setting(key, user=kwargs['user'])
+            return get_cached_setting(context, key, user_setting=True)
+        return get_cached_setting(context, key, user=kwargs['user'])
 
-    return common.models.InvenTreeSetting.get_setting(key)
+    return get_cached_setting(context, key)
 
 
 @register.simple_tag()
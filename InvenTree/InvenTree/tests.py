@@ -11,8 +11,9 @@ import django.core.exceptions as django_exceptions
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase, override_settings, tag
+from django.test import RequestFactory, TestCase, override_settings, tag
 from django.urls import reverse
 from django.utils import timezone
 
@@ -38,6 +39,7 @@ from part.models import Part, PartCategory
 from stock.models import StockItem, StockLocation
 
 from . import config, helpers, ready, status, version
+from .forms import CustomAccountAdapter, registration_enabled
 from .tasks import offload_task
 from .validators import validate_overage
 
@@ -1704,3 +1706,77 @@ class ClassProviderMixinTest(TestCase):
     def test_get_is_builtin(self):
         """Test the get_is_builtin function."""
         self.assertTrue(self.TestClass.get_is_builtin())
+
+
+class SignupTest(TestCase):
+    """Tests for user registration."""
+
+    def set_mail_restriction(self, value):
+        """Set the LOGIN_SIGNUP_MAIL_RESTRICTION setting."""
+        InvenTreeSetting.set_setting('LOGIN_SIGNUP_MAIL_RESTRICTION', value, None)
+
+    @override_settings(EMAIL_HOST='localhost')
+    def test_registration_enabled(self):
+        """Test that the registration state is cached against the request."""
+        InvenTreeSetting.set_setting('LOGIN_ENABLE_REG', True, None)
+
+        request = RequestFactory().get('/')
+
+        self.assertTrue(registration_enabled(request))
+        self.assertIs(request._registration_enabled, True)
+
+        InvenTreeSetting.set_setting('LOGIN_ENABLE_REG', False, None)
+
+        # The stored value is reused for the same request, without hitting the database
+        with self.assertNumQueries(0):
+            self.assertTrue(registration_enabled(request))
+
+        # A new request picks up the changed setting
+        request = RequestFactory().get('/')
+
+        self.assertFalse(registration_enabled(request))
+        self.assertIs(request._registration_enabled, False)
+
+    def test_email_restriction(self):
+        """Test that signup email addresses are checked against the allowed domains."""
+        adapter = CustomAccountAdapter()
+
+        # No restriction
+        self.set_mail_restriction('')
+        self.assertEqual(adapter.clean_email('a@evil.com'), 'a@evil.com')
+
+        self.set_mail_restriction('@b.com,@example.org')
+
+        # Allowed domains
+        for email in ['a@b.com', 'first.last@example.org']:
+            self.assertEqual(adapter.clean_email(email), email)
+
+        # Lookalike domains, trailing newlines and multiple '@' characters are rejected
+        for email in [
+            'a@evil.b.com',
+            'a@b.com.evil',
+            'a@xb.com',
+            'a@b.com\n',
+            'a@evil.com@b.com',
+            'a@b.com@b.com',
+            '@b.com',
+        ]:
+            with self.assertRaises(ValidationError):
+                adapter.clean_email(email)
+
+    def test_email_restriction_invalid(self):
+        """Test that an incorrectly configured mail restriction rejects all addresses."""
+        adapter = CustomAccountAdapter()
+
+        self.set_mail_restriction('@b.com')
+
+        for restriction in ['b.com', '@b.com,example.org', '@b.com, @example.org']:
+            # Invalid values are rejected by the setting validator, so write directly to the database
+            InvenTreeSetting.objects.filter(key='LOGIN_SIGNUP_MAIL_RESTRICTION').update(
+                value=restriction
+            )
+            cache.clear()
+
+            for email in ['a@b.com', 'a@example.org']:
+                with self.assertRaises(ValidationError):
+                    adapter.clean_email(email)
@@ -60,8 +60,14 @@ def inventreeInstanceTitle():
     """Returns the InstanceTitle for the current database."""
     import common.models
 
-    if common.models.InvenTreeSetting.get_setting('INVENTREE_INSTANCE_TITLE', False):
-        return common.models.InvenTreeSetting.get_setting('INVENTREE_INSTANCE', '')
+    # Fetch both settings with a single lookup
+    values = common.models.InvenTreeSetting.get_settings_bulk([
+        'INVENTREE_INSTANCE_TITLE',
+        'INVENTREE_INSTANCE',
+    ])
+
+    if values['INVENTREE_INSTANCE_TITLE']:
+        return values['INVENTREE_INSTANCE']
     return 'InvenTree'
 
 
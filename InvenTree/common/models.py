@@ -641,6 +641,14 @@ class BaseInvenTreeSetting(models.Model):
 
         setting = cls.get_setting_object(key, **kwargs)
 
+        return cls.cast_setting_value(setting, backup_value)
+
+    @classmethod
+    def cast_setting_value(cls, setting, backup_value=None):
+        """Return the (type cast) value of the provided setting object.
+
+        If no setting object is provided, return the backup value
+        """
         if setting:
             value = setting.value
 
@@ -660,6 +668,62 @@ class BaseInvenTreeSetting(models.Model):
 
         return value
 
+    @classmethod
+    def get_settings_bulk(cls, keys, **kwargs):
+        """Get the values of multiple settings, as a key:value dict.
+
+        Any settings which are not already cached are retrieved with a single database query,
+        and then added to the cache.
+        Settings which do not exist in the database are created with their default values.
+        """
+        keys = [str(key).strip().upper() for key in keys]
+
+        filters = cls.get_filters(**kwargs)
+
+        # Do not touch the cache during data import or migrations
+        do_cache = not (
+            InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations()
+        )
+
+        settings = {}
+
+        if do_cache:
+            cache_keys = {cls.create_cache_key(key, **kwargs): key for key in keys}
+
+            try:
+                # Fetch all cached settings in a single round-trip
+                cached_settings = cache.get_many(cache_keys.keys())
+            except Exception:
+                # Cache is not ready yet
+                cached_settings = {}
+                do_cache = False
+
+            for cache_key, cached_setting in cached_settings.items():
+                settings[cache_keys[cache_key]] = cached_setting
+
+        if missing_keys := [key for key in keys if key not in settings]:
+            try:
+                for setting in cls.objects.filter(key__in=missing_keys, **filters):
+                    settings[setting.key.upper()] = setting
+
+                    if do_cache:
+                        setting.save_to_cache()
+            except (IntegrityError, OperationalError, ProgrammingError):
+                # It might be the case that the database isn't created yet
+                pass
+
+            for key in missing_keys:
+                if key not in settings:
+                    # Setting does not exist yet (try to create it, and add it to the cache)
+                    settings[key] = cls.get_setting_object(key, **kwargs)
+
+        return {
+            key: cls.cast_setting_value(
+                settings.get(key), cls.get_setting_default(key, **kwargs)
+            )
+            for key in keys
+        }
+
     @classmethod
     def set_setting(cls, key, value, change_user=None, create=True, **kwargs):
         """Set the value of a particular setting. If it does not exist, option to create it.
@@ -317,6 +317,49 @@ class SettingsTest(InvenTreeTestCase):
             self.assertEqual(cache.get(cache_key).value, val)
             self.assertEqual(InvenTreeSetting.get_setting(key), val)
 
+    def test_global_settings_bulk(self):
+        """Test that multiple settings can be retrieved at once."""
+        keys = ['PART_NAME_FORMAT', 'LOGIN_MAIL_REQUIRED', 'SIGNUP_GROUP']
+
+        InvenTreeSetting.set_setting('LOGIN_MAIL_REQUIRED', True, None)
+
+        cache.clear()
+
+        values = InvenTreeSetting.get_settings_bulk(keys)
+
+        self.assertEqual(list(values.keys()), keys)
+
+        for key in keys:
+            self.assertEqual(values[key], InvenTreeSetting.get_setting(key))
+
+        # Boolean settings are cast correctly
+        self.assertIs(values['LOGIN_MAIL_REQUIRED'], True)
+
+        # Settings which exist in the database are now cached
+        cache_key = InvenTreeSetting.create_cache_key('LOGIN_MAIL_REQUIRED')
+        self.assertIsNotNone(cache.get(cache_key))
+
+        # Cached values are returned without hitting the database
+        with self.assertNumQueries(0):
+            InvenTreeSetting.get_settings_bulk(['LOGIN_MAIL_REQUIRED'])
+
+    def test_global_settings_bulk_missing(self):
+        """Test that missing settings are created (and cached) by a bulk lookup."""
+        keys = ['PART_NAME_FORMAT', 'SIGNUP_GROUP']
+
+        InvenTreeSetting.objects.filter(key__in=keys).delete()
+        cache.clear()
+
+        values = InvenTreeSetting.get_settings_bulk(keys)
+
+        for key in keys:
+            self.assertEqual(values[key], InvenTreeSetting.get_setting_default(key))
+            self.assertTrue(InvenTreeSetting.objects.filter(key=key).exists())
+
+        # Subsequent lookups are served from the cache
+        with self.assertNumQueries(0):
+            self.assertEqual(InvenTreeSetting.get_settings_bulk(keys), values)
+
     def test_user_setting_caching(self):
         """Test caching operation for the user settings class."""
         cache.clear()
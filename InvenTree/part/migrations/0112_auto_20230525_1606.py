@@ -14,9 +14,21 @@ Original error: https://github.com/inventree/InvenTree/pull/4898
 3rd fix: https://github.com/inventree/InvenTree/pull/4987
 """
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import migrations, models
 
 
+def get_column_names(schema_editor, model):
+    """Return the names of the columns which currently exist in the database table for the provided model"""
+
+    connection = schema_editor.connection
+
+    with connection.cursor() as cursor:
+        description = connection.introspection.get_table_description(cursor, model._meta.db_table)
+
+    return {column.name for column in description}
+
+
 class RemoveFieldOrSkip(migrations.RemoveField):
     """Custom RemoveField operation which will fail gracefully if the field does not exist
 
@@ -28,13 +40,20 @@ class RemoveFieldOrSkip(migrations.RemoveField):
         pass
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state) -> None:
-        """Forwards migration *attempts* to remove existing fields, but will fail gracefully if they do not exist"""
+        """Forwards migration removes existing fields, but will skip gracefully if they do not exist"""
+
+        model = from_state.apps.get_model(app_label, self.model_name)
 
         try:
-            super().database_forwards(app_label, schema_editor, from_state, to_state)
-            print(f'Removed field {self.name} from model {self.model_name}')
-        except Exception as exc:
-            pass
+            column = model._meta.get_field(self.name).column
+        except FieldDoesNotExist:
+            return
+
+        if column not in get_column_names(schema_editor, model):
+            return
+
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+        print(f'Removed field {self.name} from model {self.model_name}')
 
     def state_forwards(self, app_label, state) -> None:
         try:
@@ -53,12 +72,16 @@ class AddFieldOrSkip(migrations.AddField):
         pass
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state) -> None:
-        """Forwards migration *attempts* to remove existing fields, but will fail gracefully if they do not exist"""
+        """Forwards migration adds new fields, but will skip gracefully if they already exist"""
 
-        try:
-            super().database_forwards(app_label, schema_editor, from_state, to_state)
-        except Exception as exc:
-            pass
+        model = to_state.apps.get_model(app_label, self.model_name)
+
+        column = model._meta.get_field(self.name).column
+
+        if column in get_column_names(schema_editor, model):
+            return
+
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
 
     def state_forwards(self, app_label, state) -> None:
         try:
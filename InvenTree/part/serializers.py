@@ -1721,6 +1721,67 @@ class PartCopyBOMSerializer(serializers.Serializer):
         )
 
 
+class BomDownloadSerializer(serializers.Serializer):
+    """Serializer for the query parameters used when downloading a BOM file."""
+
+    class Meta:
+        """Metaclass defining serializer fields."""
+
+        fields = [
+            'cascade',
+            'levels',
+            'parameter_data',
+            'substitute_part_data',
+            'stock_data',
+            'supplier_data',
+            'manufacturer_data',
+            'pricing_data',
+        ]
+
+    cascade = serializers.BooleanField(
+        label=_('Cascade'), help_text=_('Include sub-assembly BOM data'), default=False
+    )
+
+    levels = serializers.IntegerField(
+        label=_('Levels'),
+        help_text=_('Maximum number of BOM levels to export'),
+        min_value=1,
+        required=False,
+        allow_null=True,
+        default=None,
+    )
+
+    parameter_data = serializers.BooleanField(
+        label=_('Parameter Data'),
+        help_text=_('Include part parameter data'),
+        default=False,
+    )
+
+    substitute_part_data = serializers.BooleanField(
+        label=_('Substitute Part Data'),
+        help_text=_('Include substitute part data'),
+        default=False,
+    )
+
+    stock_data = serializers.BooleanField(
+        label=_('Stock Data'), help_text=_('Include part stock data'), default=False
+    )
+
+    supplier_data = serializers.BooleanField(
+        label=_('Supplier Data'), help_text=_('Include supplier data'), default=False
+    )
+
+    manufacturer_data = serializers.BooleanField(
+        label=_('Manufacturer Data'),
+        help_text=_('Include manufacturer data'),
+        default=False,
+    )
+
+    pricing_data = serializers.BooleanField(
+        label=_('Pricing Data'), help_text=_('Include part pricing data'), default=False
+    )
+
+
 class BomImportUploadSerializer(InvenTree.serializers.DataFileUploadSerializer):
     """Serializer for uploading a file and extracting data from it."""
 
@@ -1,10 +1,12 @@
 """Unit testing for BOM export functionality."""
 
 import csv
+from unittest import mock
 
 from django.urls import reverse
 
 import part.models
+import part.views
 from InvenTree.settings import BASE_DIR
 from InvenTree.unit_test import InvenTreeTestCase
 
@@ -184,3 +186,38 @@ class BomExportTest(InvenTreeTestCase):
 
         content = response.headers['Content-Disposition']
         self.assertEqual(content, 'attachment; filename="BOB | Bob | A2_BOM.json"')
+
+    def test_export_params(self):
+        """Test that invalid query parameters fall back to their default values."""
+        defaults = {
+            'cascade': False,
+            'parameter_data': False,
+            'substitute_part_data': False,
+            'stock_data': False,
+            'supplier_data': False,
+            'manufacturer_data': False,
+            'pricing_data': False,
+        }
+
+        for params, expected in [
+            ({}, {}),
+            ({'levels': 2, 'cascade': 'true'}, {'max_levels': 2, 'cascade': True}),
+            ({'levels': 0}, {}),
+            ({'levels': ''}, {}),
+            ({'levels': 'abc'}, {}),
+            ({'cascade': 'abc', 'stock_data': 1}, {'stock_data': True}),
+            (
+                {'levels': '', 'cascade': 'abc', 'pricing_data': 'yes'},
+                {'pricing_data': True},
+            ),
+            ({'levels': 'abc', 'cascade': 'abc', 'stock_data': 'xyz'}, {}),
+        ]:
+            with mock.patch.object(
+                part.views, 'ExportBom', wraps=part.views.ExportBom
+            ) as export_bom:
+                response = self.client.get(self.url, data={'format': 'csv', **params})
+
+            self.assertEqual(response.status_code, 200)
+
+            kwargs = {'fmt': 'csv', 'max_levels': None, **defaults, **expected}
+            export_bom.assert_called_once_with(mock.ANY, **kwargs)
@@ -1,11 +1,13 @@
 """Tests for the Part model."""
 
 import os
+from datetime import date
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 from django.test.utils import override_settings
 
 from allauth.account.models import EmailAddress
@@ -52,6 +54,78 @@ class TemplateTagTest(InvenTreeTestCase):
         """Test that the 'add."""
         self.assertEqual(int(inventree_extras.add(3, 5)), 8)
 
+    def test_render_date(self):
+        """Test the 'render_date' template tag."""
+        self.assertEqual(inventree_extras.convert_date_format('YYYY-MM-DD'), '%Y-%m-%d')
+        self.assertEqual(
+            inventree_extras.convert_date_format('DD MMM YYYY'), '%d %b %Y'
+        )
+        self.assertEqual(inventree_extras.convert_date_format('MM/DD/YYYY'), '%m/%d/%Y')
+
+        context = {}
+
+        self.assertEqual(
+            inventree_extras.render_date(context, date(2024, 3, 7)), '2024-03-07'
+        )
+        self.assertEqual(
+            inventree_extras.render_date(context, '2024-03-07 '), '2024-03-07'
+        )
+        self.assertIsNone(inventree_extras.render_date(context, ''))
+        self.assertIsNone(inventree_extras.render_date(context, 'not-a-date'))
+
+        # The converted format is cached against the context
+        self.assertEqual(context['user_date_format'], '%Y-%m-%d')
+
+        context = {'user_date_format': '%d/%m/%Y'}
+        self.assertEqual(
+            inventree_extras.render_date(context, date(2024, 3, 7)), '07/03/2024'
+        )
+
+    def test_settings_value(self):
+        """Test that the 'settings_value' tag caches values against the request."""
+        context = {'request': RequestFactory().get('/')}
+
+        InvenTreeSetting.set_setting('PART_INTERNAL_PRICE', True, None)
+        InvenTreeUserSetting.set_setting(
+            'SEARCH_PREVIEW_RESULTS', 7, None, user=self.user
+        )
+
+        self.assertTrue(inventree_extras.settings_value(context, 'PART_INTERNAL_PRICE'))
+        self.assertEqual(
+            inventree_extras.settings_value(
+                context, 'SEARCH_PREVIEW_RESULTS', user=self.user
+            ),
+            7,
+        )
+
+        # Changes are not visible within the same request
+        InvenTreeSetting.set_setting('PART_INTERNAL_PRICE', False, None)
+        self.assertTrue(inventree_extras.settings_value(context, 'PART_INTERNAL_PRICE'))
+
+        # A new request fetches the updated value
+        context = {'request': RequestFactory().get('/')}
+        self.assertFalse(
+            inventree_extras.settings_value(context, 'PART_INTERNAL_PRICE')
+        )
+
+    def test_show_about(self):
+        """Test the 'inventree_show_about' template tag."""
+        superuser = get_user_model().objects.create_superuser(
+            'admin', 'admin@example.com', 'password'
+        )
+
+        for restrict in [False, True]:
+            InvenTreeSetting.set_setting('INVENTREE_RESTRICT_ABOUT', restrict, None)
+            context = {'request': RequestFactory().get('/')}
+
+            self.assertTrue(inventree_extras.inventree_show_about(context, superuser))
+            self.assertEqual(
+                inventree_extras.inventree_show_about(context, self.user), not restrict
+            )
+            self.assertEqual(
+                inventree_extras.inventree_show_about(context, None), not restrict
+            )
+
     def test_plugins_enabled(self):
         """Test the plugins_enabled tag."""
         self.assertEqual(inventree_extras.plugins_enabled(), True)
@@ -11,6 +11,8 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView, ListView
 
+from rest_framework import serializers
+
 from common.files import FileManager
 from common.models import InvenTreeSetting
 from common.views import FileManagementAjaxView, FileManagementFormView
@@ -22,11 +24,38 @@ from plugin.views import InvenTreePluginViewMixin
 from stock.models import StockItem, StockLocation
 
 from . import forms as part_forms
+from . import serializers as part_serializers
 from . import settings as part_settings
 from .bom import ExportBom, IsValidBOMFormat, MakeBomTemplate
 from .models import Part, PartCategory
 from .part import MakePartTemplate
 
+# Pricing values are displayed to three decimal places
+PRICING_PRECISION = Decimal('0.001')
+
+
+def fill_price_range(ctx, prefix, price_range, quantity):
+    """Add total and unit pricing for a (min, max) price range to the provided context.
+
+    Arguments:
+        ctx: The context dict to update
+        prefix: Name of the price range (e.g. 'buy_price')
+        price_range: Tuple of (min, max) prices, or None
+        quantity: The quantity used to calculate the unit price
+    """
+    if price_range is None:
+        return
+
+    min_price, max_price = price_range
+
+    if min_price:
+        ctx[f'min_total_{prefix}'] = min_price.quantize(PRICING_PRECISION)
+        ctx[f'min_unit_{prefix}'] = (min_price / quantity).quantize(PRICING_PRECISION)
+
+    if max_price:
+        ctx[f'max_total_{prefix}'] = max_price.quantize(PRICING_PRECISION)
+        ctx[f'max_unit_{prefix}'] = (max_price / quantity).quantize(PRICING_PRECISION)
+
 
 class PartIndex(InvenTreeRoleMixin, InvenTreePluginViewMixin, ListView):
     """View for displaying list of Part objects."""
@@ -490,47 +519,21 @@ class BomDownload(AjaxView):
 
         export_format = request.GET.get('format', 'csv')
 
-        cascade = str2bool(request.GET.get('cascade', False))
-
-        parameter_data = str2bool(request.GET.get('parameter_data', False))
-
-        substitute_part_data = str2bool(request.GET.get('substitute_part_data', False))
-
-        stock_data = str2bool(request.GET.get('stock_data', False))
+        params = {}
 
-        supplier_data = str2bool(request.GET.get('supplier_data', False))
-
-        manufacturer_data = str2bool(request.GET.get('manufacturer_data', False))
-
-        pricing_data = str2bool(request.GET.get('pricing_data', False))
-
-        levels = request.GET.get('levels', None)
-
-        if levels is not None:
+        # Validate each parameter separately, so that invalid values fall back to the default
+        for name, field in part_serializers.BomDownloadSerializer().fields.items():
             try:
-                levels = int(levels)
-
-                if levels <= 0:
-                    levels = None
+                params[name] = field.run_validation(field.get_value(request.GET))
+            except serializers.ValidationError:
+                params[name] = field.default
 
-            except ValueError:
-                levels = None
+        levels = params.pop('levels', None)
 
         if not IsValidBOMFormat(export_format):
             export_format = 'csv'
 
-        return ExportBom(
-            part,
-            fmt=export_format,
-            cascade=cascade,
-            max_levels=levels,
-            parameter_data=parameter_data,
-            stock_data=stock_data,
-            supplier_data=supplier_data,
-            manufacturer_data=manufacturer_data,
-            pricing_data=pricing_data,
-            substitute_part_data=substitute_part_data,
-        )
+        return ExportBom(part, fmt=export_format, max_levels=levels, **params)
 
     def get_data(self):
         """Return a custom message."""
@@ -552,11 +555,20 @@ class PartPricing(AjaxView):
         return Decimal(self.request.POST.get('quantity', 1))
 
     def get_part(self):
-        """Return the Part instance associated with this view."""
-        try:
-            return Part.objects.get(id=self.kwargs['pk'])
-        except Part.DoesNotExist:
-            return None
+        """Return the Part instance associated with this view.
+
+        The instance is cached against the view, so it is only fetched once per request.
+        """
+        if not hasattr(self, '_part'):
+            try:
+                # Supplier parts are used for both the supplier count and price range
+                self._part = Part.objects.prefetch_related('supplier_parts').get(
+                    pk=self.kwargs['pk']
+                )
+            except Part.DoesNotExist:
+                self._part = None
+
+        return self._part
 
     def get_pricing(self, quantity=1, currency=None):
         """Returns context with pricing information."""
@@ -566,9 +578,6 @@ class PartPricing(AjaxView):
         # TODO - Capacity for price comparison in different currencies
         currency = None
 
-        # Currency scaler
-        scaler = Decimal(1.0)
-
         part = self.get_part()
 
         ctx = {'part': part, 'quantity': quantity, 'currency': currency}
@@ -576,84 +585,49 @@ class PartPricing(AjaxView):
         if part is None:
             return ctx
 
+        # Quantity used for calculating unit pricing
+        qty = Decimal(quantity)
+
         # Supplier pricing information
         if part.supplier_count > 0:
-            buy_price = part.get_supplier_price_range(quantity)
-
-            if buy_price is not None:
-                min_buy_price, max_buy_price = buy_price
-
-                min_buy_price /= scaler
-                max_buy_price /= scaler
-
-                min_unit_buy_price = round(min_buy_price / quantity, 3)
-                max_unit_buy_price = round(max_buy_price / quantity, 3)
-
-                min_buy_price = round(min_buy_price, 3)
-                max_buy_price = round(max_buy_price, 3)
-
-                if min_buy_price:
-                    ctx['min_total_buy_price'] = min_buy_price
-                    ctx['min_unit_buy_price'] = min_unit_buy_price
-
-                if max_buy_price:
-                    ctx['max_total_buy_price'] = max_buy_price
-                    ctx['max_unit_buy_price'] = max_unit_buy_price
+            fill_price_range(
+                ctx, 'buy_price', part.get_supplier_price_range(quantity), qty
+            )
 
         # BOM pricing information
         if part.bom_count > 0:
             use_internal = InvenTreeSetting.get_setting(
                 'PART_BOM_USE_INTERNAL_PRICE', False
             )
-            bom_price = part.get_bom_price_range(quantity, internal=use_internal)
-            purchase_price = part.get_bom_price_range(quantity, purchase=True)
-
-            if bom_price is not None:
-                min_bom_price, max_bom_price = bom_price
-
-                min_bom_price /= scaler
-                max_bom_price /= scaler
 
-                if min_bom_price:
-                    ctx['min_total_bom_price'] = round(min_bom_price, 3)
-                    ctx['min_unit_bom_price'] = round(min_bom_price / quantity, 3)
-
-                if max_bom_price:
-                    ctx['max_total_bom_price'] = round(max_bom_price, 3)
-                    ctx['max_unit_bom_price'] = round(max_bom_price / quantity, 3)
-
-            if purchase_price is not None:
-                min_bom_purchase_price, max_bom_purchase_price = purchase_price
-
-                min_bom_purchase_price /= scaler
-                max_bom_purchase_price /= scaler
-                if min_bom_purchase_price:
-                    ctx['min_total_bom_purchase_price'] = round(
-                        min_bom_purchase_price, 3
-                    )
-                    ctx['min_unit_bom_purchase_price'] = round(
-                        min_bom_purchase_price / quantity, 3
-                    )
-
-                if max_bom_purchase_price:
-                    ctx['max_total_bom_purchase_price'] = round(
-                        max_bom_purchase_price, 3
-                    )
-                    ctx['max_unit_bom_purchase_price'] = round(
-                        max_bom_purchase_price / quantity, 3
-                    )
+            fill_price_range(
+                ctx,
+                'bom_price',
+                part.get_bom_price_range(quantity, internal=use_internal),
+                qty,
+            )
+            fill_price_range(
+                ctx,
+                'bom_purchase_price',
+                part.get_bom_price_range(quantity, purchase=True),
+                qty,
+            )
 
         # internal part pricing information
         internal_part_price = part.get_internal_price(quantity)
         if internal_part_price is not None:
-            ctx['total_internal_part_price'] = round(internal_part_price, 3)
-            ctx['unit_internal_part_price'] = round(internal_part_price / quantity, 3)
+            ctx['total_internal_part_price'] = internal_part_price.quantize(
+                PRICING_PRECISION
+            )
+            ctx['unit_internal_part_price'] = (internal_part_price / qty).quantize(
+                PRICING_PRECISION
+            )
 
         # part pricing information
         part_price = part.get_price(quantity)
         if part_price is not None:
-            ctx['total_part_price'] = round(part_price, 3)
-            ctx['unit_part_price'] = round(part_price / quantity, 3)
+            ctx['total_part_price'] = part_price.quantize(PRICING_PRECISION)
+            ctx['unit_part_price'] = (part_price / qty).quantize(PRICING_PRECISION)
 
         return ctx
 
@@ -4,6 +4,9 @@ import logging
 
 from django.core.exceptions import FieldError
 from django.db import migrations
+from django.db.models import DecimalField, Exists, F, FloatField, OuterRef, Subquery
+from django.db.models.functions import Cast
+from django.db.models.lookups import Exact
 
 logger = logging.getLogger('inventree')
 
@@ -32,6 +35,8 @@ def fix_purchase_price(apps, schema_editor):
     """
 
     StockItem = apps.get_model('stock', 'stockitem')
+    PurchaseOrderLineItem = apps.get_model('order', 'purchaseorderlineitem')
+    SupplierPart = apps.get_model('company', 'supplierpart')
 
     items = StockItem.objects.exclude(
         purchase_order=None
@@ -41,35 +46,57 @@ def fix_purchase_price(apps, schema_editor):
         purchase_price=None
     )
 
+    # Only consider stock items where the unit price matches the (undivided) line price
+    # of a matching line on the associated PurchaseOrder (and is thus incorrect)
+    # Note: An explicit Exact lookup is used for the price, as filter() would otherwise
+    # expand the money field comparison to the currency of the line itself
+    lines = PurchaseOrderLineItem.objects.filter(
+        Exact(F('purchase_price'), OuterRef('purchase_price')),
+        order=OuterRef('purchase_order'),
+        part=OuterRef('supplier_part'),
+        purchase_price_currency=OuterRef('purchase_price_currency'),
+    )
+
+    items = items.filter(Exists(lines))
+
     try:
-        items = items.exclude(supplier_part__pack_size=1)
+        # Skip invalid (or unity) pack sizes, rather than failing the migration
+        items = items.exclude(supplier_part__pack_size__in=[0, 1])
     except FieldError:
         pass
 
-    n_updated = 0
+    # Nothing to correct (e.g. a new installation)
+    if not items.exists():
+        return
+
+    # Related fields cannot be referenced directly in an UPDATE query
+    pack_size = SupplierPart.objects.filter(pk=OuterRef('supplier_part')).values('pack_size')[:1]
 
-    for item in items:
-        # Grab a reference to the associated PurchaseOrder
-        # Trying to find an absolute match between this StockItem and an associated PurchaseOrderLineItem
-        po = item.purchase_order
-        for line in po.lines.all():
-            # SupplierPart match
-            if line.part == item.supplier_part:
-                # Unit price matches original PurchaseOrder (and is thus incorrect)
-                if item.purchase_price == line.purchase_price:
-                    item.purchase_price /= item.supplier_part.pack_size
-                    item.save()
+    price = F('purchase_price')
 
-                    n_updated += 1
+    if schema_editor.connection.vendor == 'sqlite':
+        # SQLite stores whole number decimals as integers,
+        # so the division must be forced to floating point to avoid truncation
+        price = Cast(price, output_field=FloatField())
+
+    # Apply all corrections in a single UPDATE query
+    # Note: The expression is wrapped in Cast, as django-money cannot otherwise expand it
+    n_updated = items.update(
+        purchase_price=Cast(
+            price / Subquery(pack_size),
+            output_field=DecimalField(max_digits=19, decimal_places=6),
+        )
+    )
 
     if n_updated > 0:
-        logger.info(f"Corrected purchase_price field for {n_updated} stock items.")
+        logger.info("Corrected purchase_price field for %s stock items.", n_updated)
 
 
 class Migration(migrations.Migration):
 
     dependencies = [
         ('company', '0047_supplierpart_pack_size'),
+        ('order', '0049_alter_purchaseorderlineitem_unique_together'),
         ('stock', '0093_auto_20230217_2140'),
     ]
 
@@ -1,6 +1,9 @@
 """Unit tests for data migrations in the 'stock' app."""
 
+from decimal import Decimal
+
 from django_test_migrations.contrib.unittest_case import MigratorTestCase
+from djmoney.money import Money
 
 from InvenTree import unit_test
 
@@ -135,6 +138,102 @@ class TestScheduledForDeletionMigration(MigratorTestCase):
         self.assertEqual(StockItem.objects.count(), 3)
 
 
+class TestPurchasePriceMigration(MigratorTestCase):
+    """Test data migration which corrects StockItem.purchase_price for pack sizes."""
+
+    migrate_from = [
+        ('company', '0047_supplierpart_pack_size'),
+        ('order', '0049_alter_purchaseorderlineitem_unique_together'),
+        ('stock', '0093_auto_20230217_2140'),
+    ]
+    migrate_to = ('stock', '0094_auto_20230220_0025')
+
+    def prepare(self):
+        """Create stock items received against purchase orders."""
+        Company = self.old_state.apps.get_model('company', 'company')
+        Part = self.old_state.apps.get_model('part', 'part')
+        SupplierPart = self.old_state.apps.get_model('company', 'supplierpart')
+        PurchaseOrder = self.old_state.apps.get_model('order', 'purchaseorder')
+        StockItem = self.old_state.apps.get_model('stock', 'stockitem')
+
+        supplier = Company.objects.create(
+            name='Supplier', description='A supplier', is_supplier=True
+        )
+
+        part = Part.objects.create(
+            name='Part',
+            description='A purchaseable part',
+            purchaseable=True,
+            level=0,
+            tree_id=0,
+            lft=0,
+            rght=0,
+        )
+
+        sp = {}
+
+        for pack_size in [0, 1, 10]:
+            sp[pack_size] = SupplierPart.objects.create(
+                part=part,
+                supplier=supplier,
+                SKU=f'SKU-{pack_size}',
+                pack_size=pack_size,
+            )
+
+        po_1 = PurchaseOrder.objects.create(
+            supplier=supplier, reference='PO-1', description='An order'
+        )
+        po_2 = PurchaseOrder.objects.create(
+            supplier=supplier, reference='PO-2', description='Another order'
+        )
+
+        po_1.lines.create(part=sp[10], quantity=1, purchase_price=Money(100, 'USD'))
+        po_1.lines.create(part=sp[10], quantity=1, purchase_price=Money(33, 'USD'))
+        po_1.lines.create(part=sp[1], quantity=1, purchase_price=Money(50, 'USD'))
+        po_1.lines.create(part=sp[0], quantity=1, purchase_price=Money(5, 'USD'))
+
+        # Multiple lines for the same supplier part
+        po_2.lines.create(part=sp[10], quantity=1, purchase_price=Money(30, 'USD'))
+        po_2.lines.create(part=sp[10], quantity=1, purchase_price=Money(20, 'USD'))
+
+        # Map of stock item pk -> expected purchase price after migration
+        self.expected = {}
+
+        for order, supplier_part, price, expected in [
+            (po_1, sp[10], Money(100, 'USD'), Decimal('10')),
+            (po_1, sp[10], Money(33, 'USD'), Decimal('3.3')),
+            (po_2, sp[10], Money(20, 'USD'), Decimal('2')),
+            # Price does not match any order line
+            (po_1, sp[10], Money(10, 'USD'), Decimal('10')),
+            # Currency does not match the order line
+            (po_1, sp[10], Money(100, 'EUR'), Decimal('100')),
+            # Unity and invalid pack sizes are not corrected
+            (po_1, sp[1], Money(50, 'USD'), Decimal('50')),
+            (po_1, sp[0], Money(5, 'USD'), Decimal('5')),
+        ]:
+            item = StockItem.objects.create(
+                part=part,
+                supplier_part=supplier_part,
+                purchase_order=order,
+                purchase_price=price,
+                quantity=1,
+                level=0,
+                tree_id=0,
+                lft=0,
+                rght=0,
+            )
+
+            self.expected[item.pk] = expected
+
+    def test_migration(self):
+        """Test that the purchase_price field has been corrected."""
+        StockItem = self.new_state.apps.get_model('stock', 'stockitem')
+
+        for pk, expected in self.expected.items():
+            item = StockItem.objects.get(pk=pk)
+            self.assertEqual(item.purchase_price.amount, expected)
+
+
 class TestTestResultMigration(MigratorTestCase):
     """Unit tests for StockItemTestResult data migrations."""
 